@@ -24,19 +24,21 @@ Steps performed:
 5) Persist config for future runs; write a verbose log file; print summary.
 
 Quickstart:
-  python3 -m pip install --user vdf psutil
+  python3 -m pip install --user vdf
   python3 vanguard_proton_helper.py --debug
 """
-import os, sys, argparse, shutil, time, json, traceback, random
+import os, sys, argparse, shutil, time, json, traceback, random, select, socket, struct, queue, threading, atexit, functools, importlib.util
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
-try:
-    import vdf
-    import psutil
-except Exception:
-    print("Missing deps. Install with:\n  python3 -m pip install --user vdf psutil")
-    sys.exit(1)
+try:  # optional, faster config.json I/O
+    import orjson
+    def json_dumps(d): return orjson.dumps(d, option=orjson.OPT_INDENT_2).decode("utf-8")
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(d): return json.dumps(d, indent=2)
+    json_loads = json.loads
 
 DEBUG = False
 APP_NAME = "VGI"
@@ -52,11 +54,14 @@ DEFAULT_PROTON = "proton_experimental"
 DEFAULT_PRIORITY = 250
 EAC_EXE_NAME = "start_protected_game.exe"
 SHIPPING_EXE_NAME = "EVEVanguardClient-Win64-Shipping.exe"
+STEAM_PROC_NAMES = frozenset({"steam", "steam.sh"})  # Linux process names (comm), already lowercase
 
 STATE_DIR = Path.home() / ".config" / "VGI"
 LOGS_DIR = STATE_DIR / "logs"
 CONF_PATH = STATE_DIR / "config.json"
 LOG_PATH = None
+_LOG_Q = None
+_LOG_THREAD = None
 
 DISCLAIMER = ("DISCLAIMER: This tool does NOT modify CCP software. It edits local Steam config only. "
               "All rights belong to CCP hf. Use at your own risk; do not contact CCP for support.")
@@ -65,42 +70,96 @@ def ensure_state_dirs():
     STATE_DIR.mkdir(parents=True, exist_ok=True)
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+def _log_writer(path: Path, q: queue.Queue):
+    """Drain queued log lines into one open handle until the None sentinel arrives."""
+    try: fh = path.open("a", encoding="utf-8", buffering=8192)
+    except Exception: fh = None
+    while (s := q.get()) is not None:
+        if fh:
+            try:
+                fh.write(s); fh.write("\n")
+                if q.empty(): fh.flush()  # a burst of lines costs one write(2); the file still catches up when idle
+            except Exception: pass
+    if fh: fh.close()
+
+def _close_log():
+    global _LOG_Q
+    if _LOG_Q:
+        _LOG_Q.put_nowait(None); _LOG_THREAD.join(timeout=5); _LOG_Q = None
+
 def new_log_file():
-    global LOG_PATH
+    global LOG_PATH, _LOG_Q, _LOG_THREAD
     ensure_state_dirs()
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     LOG_PATH = LOGS_DIR / f"run-{ts}.log"
+    _close_log()
+    _LOG_Q = queue.Queue()
+    _LOG_THREAD = threading.Thread(target=_log_writer, args=(LOG_PATH, _LOG_Q), name="vgi-log", daemon=True)
+    _LOG_THREAD.start()
+    atexit.register(_close_log)
     return LOG_PATH
 
 def _write_log_line(s: str):
-    if LOG_PATH:
-        try:
-            with LOG_PATH.open("a", encoding="utf-8") as fh:
-                fh.write(s + "\n")
-        except Exception:
-            pass
+    if _LOG_Q: _LOG_Q.put_nowait(s)
 
+# Each message is built once and shared by stdout and the log queue; stdout's own buffer makes it one write per line.
 def log(*a):
-    msg = " ".join(str(x) for x in a)
-    if DEBUG: print("[DEBUG]", msg)
-    _write_log_line("[DEBUG] " + msg)
+    line = "[DEBUG] " + " ".join(str(x) for x in a)
+    if DEBUG: print(line)
+    _write_log_line(line)
 
 def info(*a):
-    msg = " ".join(str(x) for x in a)
-    print(msg); _write_log_line(msg)
+    line = " ".join(str(x) for x in a)
+    print(line); _write_log_line(line)
+
+def info_lines(lines):
+    """info() for several lines at once: one print and one log entry."""
+    if lines:
+        block = "\n".join(lines)
+        print(block); _write_log_line(block)
 
 def err(*a):
-    msg = " ".join(str(x) for x in a)
-    print("ERROR:", msg); _write_log_line("ERROR: " + msg)
+    line = "ERROR: " + " ".join(str(x) for x in a)
+    print(line); _write_log_line(line)
+
 
+@functools.lru_cache(maxsize=None)
+def _vdf():
+    """Import vdf on first use."""
+    import vdf
+    return vdf
+
+@functools.lru_cache(maxsize=None)
+def _psutil():
+    """Import psutil on first use; only needed where there is no procfs. Warns once if it is old."""
+    import psutil
+    try:
+        if tuple(map(int, psutil.__version__.split(".")[:2])) < (6, 0):
+            info(f"NOTE: psutil {psutil.__version__} is slow at process scanning; 6.0+ is much faster:\n"
+                 "  python3 -m pip install --user -U psutil")
+    except ValueError:
+        pass
+    return psutil
+
+def _proc_pids():
+    """Numeric entries of /proc, or None when there is no procfs (non-Linux)."""
+    try: return [p for p in os.listdir("/proc") if p.isdigit()]
+    except OSError: return None
+
+def _read_proc_comm(pid):
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as fh: return fh.read().rstrip(b"\n").decode("utf-8", "replace")
+    except OSError:
+        return None
 
 def is_steam_running(_hint=None):
-    names = {"steam","steam.sh"}
-    for p in psutil.process_iter(attrs=("name","exe")):
+    pids = _proc_pids()
+    if pids is not None:
+        return any(_read_proc_comm(pid) in STEAM_PROC_NAMES for pid in pids)
+    psutil = _psutil()
+    for p in psutil.process_iter(attrs=("name",)):
         try:
-            n = (p.info.get("name") or "").lower()
-            base = os.path.basename((p.info.get("exe") or "")).lower()
-            if n in names or base in names: return True
+            if p.info.get("name") in STEAM_PROC_NAMES: return True
         except psutil.Error:
             pass
     return False
@@ -117,9 +176,10 @@ def find_userdata_roots(steam_root_hint: str|None):
 
 def find_profile_shortcuts(userdata_dir: Path):
     out = []
-    for p in userdata_dir.iterdir():
-        if p.is_dir() and p.name.isdigit():
-            out.append((p.name, p / "config" / "shortcuts.vdf"))
+    with os.scandir(userdata_dir) as it:
+        for e in it:
+            if e.name.isdigit() and e.is_dir():
+                out.append((e.name, Path(e.path) / "config" / "shortcuts.vdf"))
     return out
 
 def read_library_folders(steam_root: Path):
@@ -142,43 +202,96 @@ def search_compat_pfx_across_libraries(library_roots, compat_id: str):
         if pfx.is_dir(): return pfx
     return None
 
+FICLONE = 0x40049409  # linux/fs.h _IOW(0x94, 9, int)
+
+def _reflink(src: Path, dst: Path):
+    """Copy-on-write clone src -> dst (btrfs/xfs); raises OSError/ImportError where unsupported.
+
+    src is opened first so a missing file always surfaces as FileNotFoundError."""
+    with src.open("rb") as fs:
+        import fcntl
+        with dst.open("wb") as fd:
+            try: fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+            except OSError:
+                fd.close(); dst.unlink(missing_ok=True); raise
+    shutil.copystat(src, dst)
+
 def backup(path: Path):
-    if not path.exists(): return None
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     bp = path.with_name(path.name + f".bak.{ts}")
-    shutil.copy2(path, bp); log("Backup ->", bp); return bp
+    try: _reflink(path, bp)
+    except FileNotFoundError: return None
+    except (OSError, ImportError): shutil.copy2(path, bp)
+    log("Backup ->", bp); return bp
 
 def read_shortcuts(path: Path):
     if not path.parent.exists(): path.parent.mkdir(parents=True, exist_ok=True)
-    if not path.exists(): return {"shortcuts": {}}
-    with path.open("rb") as fh: return vdf.binary_load(fh)
+    try:
+        return _vdf().binary_loads(path.read_bytes())
+    except FileNotFoundError:
+        return {"shortcuts": {}}
 
-def write_shortcuts(path: Path, obj):
+def atomic_write(path: Path, data: bytes):
+    """Write data to a sibling temp file in one go, then rename it over path."""
     if not path.parent.exists(): path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("wb") as fh: vdf.binary_dump(obj, fh)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(data); fh.flush(); os.fsync(fh.fileno())
+    try: shutil.copymode(path, tmp)
+    except FileNotFoundError: pass
+    os.replace(tmp, path)
+
+def write_shortcuts(path: Path, obj):
+    atomic_write(path, _vdf().binary_dumps(obj))
 
 def read_text_vdf(path: Path):
-    if not path.exists(): return {}
-    with path.open("r", encoding="utf-8", errors="ignore") as fh: return vdf.load(fh)
+    try:
+        return _vdf().loads(path.read_text(encoding="utf-8", errors="ignore"))
+    except FileNotFoundError:
+        return {}
 
 def write_text_vdf(path: Path, obj):
-    if not path.parent.exists(): path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh: vdf.dump(obj, fh, pretty=True)
+    atomic_write(path, _vdf().dumps(obj, pretty=True).encode("utf-8"))
+
+SKIP_SCAN_RELS = {"windows", "programdata", "$recycle.bin"}  # lowercased, relative to drive_c; never hold the Vanguard install
+EAC_CANDIDATE_RELS = [  # where the EVE launcher installs Vanguard, relative to the prefix
+    f"drive_c/CCP/EVE/eve-vanguard/live/WindowsClient/{EAC_EXE_NAME}",
+]
+
+def _skip_scan_dir(rel: str):
+    """True for drive_c-relative dirs (lowercased) the scan prunes: system folders and users/<u>/AppData/Local/Temp."""
+    if rel in SKIP_SCAN_RELS: return True
+    parts = rel.split("/")
+    return len(parts) == 5 and parts[0] == "users" and parts[2:] == ["appdata", "local", "temp"]
 
 def find_eac_exe_under_pfx(pfx: Path):
     """Return relative path (from pfx) to start_protected_game.exe, or None."""
-    search_base = pfx / "drive_c"
-    if not search_base.exists(): return None
-    for p in search_base.rglob(EAC_EXE_NAME):
-        return str(p.relative_to(pfx)).replace("\\","/")
+    for rel in EAC_CANDIDATE_RELS:
+        if (pfx / rel).is_file(): return rel
+    dq = deque([(str(pfx / "drive_c"), "")])
+    while dq:
+        path, rel = dq.popleft()
+        try: it = os.scandir(path)
+        except OSError: continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        sub = f"{rel}/{e.name.lower()}" if rel else e.name.lower()
+                        if not _skip_scan_dir(sub): dq.append((e.path, sub))
+                    elif e.name == EAC_EXE_NAME:
+                        return str(Path(e.path).relative_to(pfx)).replace("\\","/")
+                except OSError:
+                    pass
     return None
 
 def validate_prefix_and_eac(prefix: str|Path, exe_rel: str|None):
+    if not exe_rel or not exe_rel.endswith(EAC_EXE_NAME): return False
     try:
-        prefix = Path(prefix).expanduser()
-        if not (prefix.is_dir() and (prefix / "drive_c").exists()): return False
-        if not exe_rel or not exe_rel.endswith(EAC_EXE_NAME): return False
-        return (prefix / exe_rel).is_file()
+        prefix = os.path.expanduser(prefix)
+        # An exe under drive_c/ already proves the prefix and drive_c exist; a single stat covers all three.
+        if not exe_rel.startswith("drive_c/") and not os.path.isdir(os.path.join(prefix, "drive_c")): return False
+        return os.path.isfile(os.path.join(prefix, exe_rel))
     except Exception:
         return False
 
@@ -192,32 +305,50 @@ def auto_discover_eac(steam_root: Path, compat_id: str):
     return None, None
 
 def find_numeric_container(node):
-    if isinstance(node, dict):
-        if node and all(isinstance(k, str) and k.isdigit() for k in node.keys()): return node
-        for v in node.values():
-            if isinstance(v, dict):
-                got = find_numeric_container(v)
-                if got: return got
+    """Breadth-first search for the first non-empty dict whose keys are all digit strings."""
+    if not isinstance(node, dict): return None
+    isdigit = str.isdigit
+    dq = deque([node])  # only dicts are ever queued
+    while dq:
+        n = dq.popleft()
+        first = next(iter(n), None)
+        # Checking the first key alone rejects almost every non-container dict before a full key scan.
+        if isinstance(first, str) and isdigit(first):
+            for k in n:
+                if not (isinstance(k, str) and isdigit(k)): break
+            else:
+                return n
+        dq.extend(v for v in n.values() if isinstance(v, dict))
     return None
 
 def next_index(container: dict):
     nums = [int(k) for k in container.keys() if k.isdigit()]
     return str((max(nums)+1) if nums else 0)
 
+SHORTCUT_TEMPLATE = {  # defaults for the fields this tool writes; make_shortcut fills in the per-run ones
+    "appid": 0,
+    "appname": "",
+    "exe": "",
+    "StartDir": "",
+    "icon": "",
+    "ShortcutPath": "",
+    "LaunchOptions": "",
+    "IsHidden": 0,
+    "AllowDesktopConfig": 1,
+    "OpenVR": 0,
+    "tags": {"0": "Non-Steam"},
+}
+
 def make_shortcut(name, exe, startdir, icon="", launch_opts=""):
-    return {
-        "appid": random.randint(-2147483648, -1),
-        "appname": name,
-        "exe": exe,
-        "StartDir": startdir,
-        "icon": icon or "",
-        "ShortcutPath": "",
-        "LaunchOptions": launch_opts,
-        "IsHidden": 0,
-        "AllowDesktopConfig": 1,
-        "OpenVR": 0,
-        "tags": {"0": "Non-Steam"},
-    }
+    entry = SHORTCUT_TEMPLATE.copy()
+    entry["appid"] = (random.getrandbits(31) | 0x80000000) - (1 << 32)  # signed 32-bit, top bit always set
+    entry["appname"] = name
+    entry["exe"] = exe
+    entry["StartDir"] = startdir
+    entry["icon"] = icon or ""
+    entry["LaunchOptions"] = launch_opts
+    entry["tags"] = dict(SHORTCUT_TEMPLATE["tags"])  # copy() is shallow
+    return entry
 
 def inject_shortcut(shortcuts_path: Path, name, exe, startdir, icon="", launch_opts="", dry=False):
     obj = read_shortcuts(shortcuts_path)
@@ -232,83 +363,211 @@ def inject_shortcut(shortcuts_path: Path, name, exe, startdir, icon="", launch_o
         info(json.dumps(entry, indent=2)); return idx, entry
     backup(shortcuts_path); write_shortcuts(shortcuts_path, obj); return idx, entry
 
+def _vdf_escape(v):
+    return str(v).replace("\\", "\\\\").replace('"', '\\"')
+
+def splice_compat_mapping(config_vdf_path: Path, text: str, key: str, value: dict):
+    """Insert one new CompatToolMapping entry into config.vdf's text (as just read) without re-serializing it.
+
+    Returns False (caller rewrites the whole file) when the section can't be located unambiguously."""
+    marker = '"CompatToolMapping"'
+    if text.count(marker) != 1: return False
+    i = text.index(marker) + len(marker)
+    while i < len(text) and text[i].isspace(): i += 1
+    if i >= len(text) or text[i] != "{": return False
+    # Find the section's closing brace, ignoring braces inside quoted (escaped) strings.
+    depth, quoted, j = 0, False, i
+    while j < len(text):
+        c = text[j]
+        if quoted:
+            if c == "\\": j += 1
+            elif c == '"': quoted = False
+        elif c == '"': quoted = True
+        elif c == "{": depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0: break
+        j += 1
+    else:
+        return False
+    line_start = text.rfind("\n", 0, j) + 1
+    indent = text[line_start:j]
+    if indent.strip(): return False  # closing brace shares its line with other tokens
+    inner = indent + "\t"
+    frag = (f'{inner}"{_vdf_escape(key)}"\n{inner}{{\n'
+            + "".join(f'{inner}\t"{_vdf_escape(k)}"\t\t"{_vdf_escape(v)}"\n' for k, v in value.items())
+            + f"{inner}}}\n")
+    atomic_write(config_vdf_path, (text[:line_start] + frag + text[line_start:]).encode("utf-8"))
+    return True
+
 def set_compat_tool(config_vdf_path: Path, appid: int, tool_name: str, priority: int = DEFAULT_PRIORITY, dry=False):
-    root = read_text_vdf(config_vdf_path) if config_vdf_path.exists() else {}
-    store = root.setdefault("InstallConfigStore",{}).setdefault("Software",{}).setdefault("Valve",{}).setdefault("Steam",{})
-    mapping = store.setdefault("CompatToolMapping",{})
-    key = str(appid); mapping[key] = {"name": tool_name, "config": "", "Priority": str(priority)}
+    # Read the text once: it is both parsed here and, for a new key, spliced into directly.
+    try: text = config_vdf_path.read_text(encoding="utf-8", errors="ignore")
+    except FileNotFoundError: text = None
+    root = _vdf().loads(text) if text is not None else {}
+    try:  # existing config.vdf: plain subscripts, no method calls
+        mapping = root["InstallConfigStore"]["Software"]["Valve"]["Steam"]["CompatToolMapping"]; found = True
+    except KeyError:
+        found = False
+        store = root.setdefault("InstallConfigStore",{}).setdefault("Software",{}).setdefault("Valve",{}).setdefault("Steam",{})
+        mapping = store.setdefault("CompatToolMapping",{})
+    key = str(appid); is_new = key not in mapping
+    mapping[key] = {"name": tool_name, "config": "", "Priority": str(priority)}
     if dry:
         info("DRY RUN: would write CompatToolMapping in", str(config_vdf_path)); info(f'{key}: {mapping[key]}'); return
-    if config_vdf_path.exists(): backup(config_vdf_path)
+    backup(config_vdf_path)
+    # A brand-new key can be spliced into the text only if the parse found the mapping at the path
+    # get_compat_tool reads; otherwise the splice could hit another section, so do a full rewrite.
+    if found and is_new and text is not None and splice_compat_mapping(config_vdf_path, text, key, mapping[key]):
+        log("Spliced CompatToolMapping entry into", config_vdf_path); return
     write_text_vdf(config_vdf_path, root)
 
-def get_compat_tool(config_vdf_path: Path, appid: int):
-    if not config_vdf_path.exists(): return None
+def get_compat_tool(config_vdf_path: Path, appid: int, root=None):
     try:
-        root = read_text_vdf(config_vdf_path)
+        if root is None: root = read_text_vdf(config_vdf_path)
         return (root.get("InstallConfigStore",{}).get("Software",{}).get("Valve",{}).get("Steam",{}).get("CompatToolMapping",{}).get(str(appid)))
     except Exception:
         return None
 
-def scan_vanguard_args(timeout=120, poll=2):
-
-    marker = SHIPPING_EXE_NAME
+def read_cmdline(pid, needle: bytes|None = None):
+    """Return the argv list of a PID from /proc, or None if it exited, is unreadable, or lacks needle."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as fh: raw = fh.read()
+    except OSError:
+        return None
+    if not raw or (needle and needle not in raw): return None
+    return raw.rstrip(b"\0").decode("utf-8", "replace").split("\0")
+
+def iter_cmdlines(needle: bytes|None = None):
+    """Yield argv lists for running processes, read straight from /proc (psutil if /proc is missing).
+
+    With needle set, only cmdlines whose raw bytes contain it are decoded and yielded."""
+    pids = _proc_pids()
+    if pids is None:
+        psutil = _psutil()
+        marker = needle.decode("utf-8") if needle else None
+        for p in psutil.process_iter(attrs=("cmdline",)):
+            try: cmd = p.info.get("cmdline") or []
+            except psutil.Error: continue
+            # Test each arg in place rather than joining the whole cmdline just to search it.
+            if marker is None or any(marker in a for a in cmd): yield cmd
+        return
+    for pid in pids:
+        cmd = read_cmdline(pid, needle)
+        if cmd: yield cmd
+
+# Netlink proc connector (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_EXEC = 0x00000002
+NLMSG_DONE = 3
+
+def open_exec_listener():
+    """Subscribe to kernel exec events; returns the socket, or None where the kernel refuses the subscription (or non-Linux)."""
+    if not hasattr(socket, "AF_NETLINK"): return None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+    except OSError as e:
+        log("proc connector unavailable:", e); return None
+    try:
+        sock.bind((0, CN_IDX_PROC))
+        cn = struct.pack("=IIIIHHI", CN_IDX_PROC, CN_VAL_PROC, 0, 0, 4, 0, PROC_CN_MCAST_LISTEN)
+        sock.send(struct.pack("=IHHII", 16 + len(cn), NLMSG_DONE, 0, 0, 0) + cn)
+    except OSError as e:
+        log("proc connector unavailable:", e); sock.close(); return None
+    log("Listening for exec events on the netlink proc connector")
+    return sock
+
+def read_exec_pids(sock):
+    """Drain one proc connector message; return the PIDs that just called exec()."""
+    try: data = sock.recv(4096)
+    except OSError: return []
+    # nlmsghdr (16) + cn_msg (20) + proc_event{what, cpu, timestamp_ns, exec{pid, tgid}}
+    if len(data) < 60: return []
+    what, = struct.unpack_from("=I", data, 36)
+    if what != PROC_EVENT_EXEC: return []
+    _pid, tgid = struct.unpack_from("=II", data, 52)
+    return [tgid]
+
+def vanguard_tail(cmd):
+    """Return the args following the Shipping exe in an argv list, or None if it is not Vanguard."""
+    joined = " ".join(cmd)
+    if SHIPPING_EXE_NAME not in joined: return None
+    tail = joined.split(SHIPPING_EXE_NAME,1)[1].strip()
+    if tail.startswith('"') and tail.endswith('"'): tail = tail[1:-1]
+    return tail
+
+def scan_vanguard_args(timeout=120, poll=0.5, max_poll=5.0, backoff=1.5):
+
+    marker = SHIPPING_EXE_NAME.encode()
     deadline = time.time() + timeout
     info("Waiting to capture Vanguard runtime args (launch via the EVE Online launcher)…")
-    while time.time() < deadline:
-        for p in psutil.process_iter(attrs=("pid","cmdline")):
-            try:
-                cmd = p.info.get("cmdline") or []
-                if not cmd: continue
-                joined = " ".join(cmd)
-                if marker in joined:
-                    tail = joined.split(marker,1)[1].strip()
-                    if tail.startswith('"') and tail.endswith('"'): tail = tail[1:-1]
-                    info("Captured runtime args:", tail)
-                    return tail
-            except psutil.Error: pass
-        time.sleep(poll)
+    sock = open_exec_listener()
+    interval = poll
+    try:
+        while time.time() < deadline:
+            for cmd in iter_cmdlines(marker):
+                tail = vanguard_tail(cmd)
+                if tail is not None:
+                    info("Captured runtime args:", tail); return tail
+            # Poll quickly at first, then back off: the longer nothing shows up, the less a full rescan is worth.
+            until = min(deadline, time.time() + interval)
+            interval = min(interval * backoff, max_poll)
+            if not sock:
+                time.sleep(max(0, until - time.time())); continue
+            # Between full scans, check each process as the kernel reports its exec, so short-lived ones aren't missed.
+            while (left := until - time.time()) > 0 and select.select([sock], [], [], left)[0]:
+                for pid in read_exec_pids(sock):
+                    tail = vanguard_tail(read_cmdline(pid, marker) or [])
+                    if tail is not None:
+                        info("Captured runtime args:", tail); return tail
+    finally:
+        if sock: sock.close()
     info("No args captured within timeout."); return ""
 
 def load_saved_config():
-    if not CONF_PATH.exists(): return {}
-    try: return json.loads(CONF_PATH.read_text(encoding="utf-8"))
+    try: return json_loads(CONF_PATH.read_bytes())
     except Exception: return {}
 
 def save_config(d: dict):
     ensure_state_dirs()
-    with CONF_PATH.open("w", encoding="utf-8") as fh: json.dump(d, fh, indent=2)
+    CONF_PATH.write_text(json_dumps(d), encoding="utf-8")
 
 def print_status(saved: dict, steam_root: Path|None, profile_id: str|None, shortcuts_path: Path|None, config_vdf: Path|None, name: str):
-    info("=== Status ===")
-    info("Saved config path:", str(CONF_PATH))
-    info("Log file:", str(LOG_PATH) if LOG_PATH else "(none)")
-    if saved: info("Saved config keys:", ", ".join(sorted(saved.keys())))
-    if steam_root: info("Steam root:", str(steam_root))
-    if profile_id: info("Profile ID:", profile_id)
-    if shortcuts_path and shortcuts_path.exists(): info("shortcuts.vdf:", str(shortcuts_path))
-    if config_vdf and config_vdf.exists(): info("config.vdf:", str(config_vdf))
+    out = ["=== Status ===", f"Saved config path: {CONF_PATH}", f"Log file: {LOG_PATH if LOG_PATH else '(none)'}"]
+    if saved: out.append("Saved config keys: " + ", ".join(sorted(saved.keys())))
+    if steam_root: out.append(f"Steam root: {steam_root}")
+    if profile_id: out.append(f"Profile ID: {profile_id}")
+    if shortcuts_path and shortcuts_path.exists(): out.append(f"shortcuts.vdf: {shortcuts_path}")
+    if config_vdf and config_vdf.exists(): out.append(f"config.vdf: {config_vdf}")
+    failed = None
     try:
         if shortcuts_path and shortcuts_path.exists():
             obj = read_shortcuts(shortcuts_path)
             container = find_numeric_container(obj) or obj.get("shortcuts") or obj
+            cfg_root = read_text_vdf(config_vdf) if config_vdf else {}
             for k, ent in container.items():
                 if isinstance(ent, dict) and ent.get("appname") == name:
-                    appid = ent["appid"]; mapping = get_compat_tool(config_vdf, appid) if config_vdf else None
-                    info(f"Detected shortcut index: {k}")
-                    info(f"Shortcut AppID: {appid}")
-                    info(f"LaunchOptions: {ent.get('LaunchOptions','')!r}")
-                    info(f"Target exe: {ent.get('exe')}")
-                    info(f"Proton mapping: {mapping if mapping else '(none)'}")
+                    appid = ent["appid"]; mapping = get_compat_tool(config_vdf, appid & 0xFFFFFFFF, root=cfg_root)
+                    out += [f"Detected shortcut index: {k}",
+                            f"Shortcut AppID: {appid}",
+                            f"LaunchOptions: {ent.get('LaunchOptions','')!r}",
+                            f"Target exe: {ent.get('exe')}",
+                            f"Proton mapping: {mapping if mapping else '(none)'}"]
                     break
-    except Exception as e: err("Status check failed:", str(e))
+    except Exception as e: failed = e
+    info_lines(out)
+    if failed: err("Status check failed:", str(failed))
 
 
 def run_injection(args):
-    if is_steam_running(args.steam_root) and not args.dry_run and not args.force:
+    check_steam = not (args.dry_run or args.force)  # evaluated first so these modes never scan processes
+    if check_steam and is_steam_running(args.steam_root):
         err("Please EXIT Steam before running (or pass --force)."); sys.exit(1)
 
-    saved = load_saved_config(); log("Loaded saved config:", json.dumps(saved, indent=2) if saved else "(none)")
+    saved = load_saved_config()
+    if DEBUG: log("Loaded saved config:", json_dumps(saved) if saved else "(none)")
 
 
     steam_root = Path(saved.get("steam_root")) if saved.get("steam_root") else None
@@ -344,8 +603,10 @@ def run_injection(args):
         eac_rel = args.exe.replace("\\","/")
 
 
-    if not validate_prefix_and_eac(prefix or "", eac_rel):
+    valid = validate_prefix_and_eac(prefix or "", eac_rel)
+    if not valid:
         prefix, eac_rel = auto_discover_eac(steam_root, compat_id)
+        valid = bool(prefix and eac_rel)  # discovery only returns an exe it found on disk
 
     if not prefix or not eac_rel:
         if args.no_prompt:
@@ -355,7 +616,7 @@ def run_injection(args):
         eac_rel = input(f"Enter path to {EAC_EXE_NAME} relative to that prefix: ").strip()
 
 
-    if not validate_prefix_and_eac(prefix, eac_rel):
+    if not valid and not validate_prefix_and_eac(prefix, eac_rel):
         err("Resolved EAC exe not found.",
             "\n  PREFIX =", prefix,
             "\n  EXE_REL =", eac_rel,
@@ -366,35 +627,26 @@ def run_injection(args):
     if not args.dry_run:
         tail = scan_vanguard_args(timeout=args.timeout)
 
-    info("Waiting for Steam to exit before continuing")
-    while is_steam_running(args.steam_root) and not args.dry_run and not args.force:
-        time.sleep(1)
+    if check_steam:
+        info("Waiting for Steam to exit before continuing")
+        while is_steam_running(args.steam_root):
+            time.sleep(1)
 
 
     eac_abs_path = (Path(prefix).expanduser() / eac_rel).resolve()
     eac_abs = str(eac_abs_path); startdir = str(eac_abs_path.parent)
 
-    idx, entry = inject_shortcut(shortcuts_path, args.name, eac_abs, startdir, args.icon, "", args.dry_run)
-    info(f"Shortcut injected (index {idx}) at {shortcuts_path}")
-    info(f"Target exe (EAC): {eac_abs}")
-
-
-    if tail:
-        obj = read_shortcuts(shortcuts_path)
-        container = find_numeric_container(obj) or obj.get("shortcuts") or obj
-        if idx in container:
-            container[idx]["LaunchOptions"] = tail
-            backup(shortcuts_path); write_shortcuts(shortcuts_path, obj)
-            info("Patched LaunchOptions =", tail)
-    else:
-        info("Proceeding without LaunchOptions (none captured).")
+    # Args are captured before injection, so LaunchOptions goes in with the entry: one backup, one write.
+    idx, entry = inject_shortcut(shortcuts_path, args.name, eac_abs, startdir, args.icon, tail, args.dry_run)
+    info_lines([f"Shortcut injected (index {idx}) at {shortcuts_path}",
+                f"Target exe (EAC): {eac_abs}",
+                f"LaunchOptions = {tail}" if tail else "Proceeding without LaunchOptions (none captured)."])
 
 
-    appid = entry["appid"] + (1<<32)
-    info(f"Computed AppID: {appid}")
+    appid = entry["appid"] & 0xFFFFFFFF
     set_compat_tool(config_vdf, appid, args.proton, args.priority, args.dry_run)
-    info(f"Set CompatToolMapping for AppID {appid} -> '{args.proton}'")
-
+    info_lines([f"Computed AppID: {appid}",
+                f"Set CompatToolMapping for AppID {appid} -> '{args.proton}'"])
 
     state = {
         "steam_root": str(steam_root),
@@ -410,11 +662,29 @@ def run_injection(args):
         "compatdata_id": compat_id,
         "target": "eac",
     }
-    save_config(state); info(f"Saved config -> {CONF_PATH}")
-    info("Done. Start Steam and launch the new shortcut.")
-
-def run_status():
+    if args.dry_run:
+        # --status answers from this file, so a preview must not leave state Steam never received.
+        info(f"DRY RUN: would save config -> {CONF_PATH}"); return
+    save_config(state)
+    info_lines([f"Saved config -> {CONF_PATH}",
+                "Done. Start Steam and launch the new shortcut."])
+
+def print_saved_status(saved: dict):
+    out = ["=== Status (saved; pass --verify to re-read Steam files) ===", f"Saved config path: {CONF_PATH}"]
+    if saved.get("steam_root"): out.append(f"Steam root: {saved['steam_root']}")
+    if saved.get("profile_id"): out.append(f"Profile ID: {saved['profile_id']}")
+    out.append(f"Shortcut name: {saved.get('shortcut_name', DEFAULT_SHORTCUT_NAME)}")
+    out.append(f"Non-Steam AppID: {saved['appid']}")
+    if saved.get("prefix") and saved.get("exe_rel"): out.append(f"Target exe: {Path(saved['prefix']).expanduser() / saved['exe_rel']}")
+    out.append(f"Proton tool: {saved.get('proton_tool', DEFAULT_PROTON)} (priority {saved.get('priority', DEFAULT_PRIORITY)})")
+    info_lines(out)
+
+def run_status(verify=False):
     saved = load_saved_config()
+    if "appid" in saved and not verify:
+        # The last run saved everything the summary needs; only --verify parses shortcuts.vdf/config.vdf.
+        print_saved_status(saved)
+        info(f"Log file: {LOG_PATH}"); return
     steam_root = Path(saved["steam_root"]) if "steam_root" in saved else None
     shortcuts_path = Path(saved["shortcuts_vdf"]) if "shortcuts_vdf" in saved else None
     config_vdf = Path(saved["config_vdf"]) if "config_vdf" in saved else None
@@ -424,8 +694,6 @@ def run_status():
 
 def main():
     global DEBUG, LOG_PATH
-    LOG_PATH = new_log_file()
-
     ap = argparse.ArgumentParser(description=f"{APP_NAME}: inject Steam shortcut to EAC, capture args, set Proton.")
     ap.add_argument("--steam-root", help="Steam root (e.g. ~/.local/share/Steam)")
     ap.add_argument("--compatdata-id", help=f"Compatdata AppID folder to search (default {DEFAULT_COMPATDATA_ID})")
@@ -439,10 +707,20 @@ def main():
     ap.add_argument("--dry-run", action="store_true", help="Preview only; no writes")
     ap.add_argument("--no-prompt", action="store_true", help="Disable prompts on discovery failure")
     ap.add_argument("--status", action="store_true", help="Show status and exit")
+    ap.add_argument("--verify", action="store_true", help="With --status, re-read shortcuts.vdf/config.vdf instead of the saved summary")
     ap.add_argument("--force", action="store_true", help="Bypass Steam-running check")
     ap.add_argument("--debug", action="store_true", help="Verbose console output")
     args = ap.parse_args()
+    if args.verify and not args.status: ap.error("--verify requires --status")
     DEBUG = args.debug
+    # Deps are imported lazily where used (so --help needs neither); just confirm they are installed up front.
+    # Process scans read /proc directly, so psutil is only needed without procfs.
+    deps = ["vdf"] + (["psutil"] if _proc_pids() is None else [])
+    missing = [m for m in deps if not importlib.util.find_spec(m)]
+    if missing:
+        print("Missing deps. Install with:\n  python3 -m pip install --user " + " ".join(missing))
+        sys.exit(1)
+    LOG_PATH = new_log_file()
 
     info(DISCLAIMER)
     info(f"{APP_NAME} starting…")
@@ -450,7 +728,7 @@ def main():
 
     try:
         if args.status:
-            run_status(); return
+            run_status(args.verify); return
         run_injection(args)
     except KeyboardInterrupt:
         err("Interrupted by user.")